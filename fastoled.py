@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Faster SSD1306 I2C driver for the OLED stats scripts
+
+Drop-in subclass of adafruit_ssd1306.SSD1306_I2C. Instead of sending the whole
+1024 byte framebuffer on every show(), it compares the framebuffer with the one
+sent last time and only transmits the pages (8 pixel high rows) that changed,
+or nothing at all when the frame is identical.
+The first frame, and every FULL_REFRESH frames after that, is sent in full so
+the display can never stay out of step with the buffer.
+
+The column/page window commands are sent as one command stream in a single I2C
+transaction, and only when the window actually changes, so a full refresh is
+exactly one transaction carrying the whole framebuffer.
+
+image() packs a PIL image into the framebuffer with PIL's C routines instead of
+the per-pixel Python loop in the Adafruit library. FastSSD1306_SPI only adds that
+faster image(): over SPI the whole framebuffer takes about a millisecond, so its
+show() is left as it is.
+"""
+
+import adafruit_ssd1306
+from PIL import Image
+
+# Send the whole framebuffer every FULL_REFRESH frames
+FULL_REFRESH = 100
+
+# SSD1306 commands
+SET_COL_ADDR = 0x21
+SET_PAGE_ADDR = 0x22
+
+
+class FastImageMixin:
+    """image() for the SSD1306 drivers, packing PIL images in C."""
+
+    def image(self, img):
+        """
+        Set the framebuffer to a 1-bit PIL image the size of the display.
+
+        Rotating the image 90 degrees clockwise turns every display column into
+        one packed row of bytes, one byte per page with the bottom page first and
+        the top pixel of the page in bit 0, which is exactly the SSD1306 layout.
+        Each page is then copied out of those rows with a strided slice.
+        """
+        if self.rotation != 0 or img.mode != "1" or img.size != (self.width, self.height):
+            super().image(img)
+            return
+        data = img.transpose(Image.ROTATE_270).tobytes()
+        pages = self.pages
+        width = self.width
+        for page in range(pages):
+            self.buf[page * width:(page + 1) * width] = data[pages - 1 - page::pages]
+
+
+class FastSSD1306_I2C(FastImageMixin, adafruit_ssd1306.SSD1306_I2C):
+    """SSD1306_I2C whose show() only sends the dirty pages of the framebuffer."""
+
+    def __init__(self, width, height, i2c, **kwargs):
+        # init_display() already calls show(), so the diff state has to exist
+        # before the parent constructor runs
+        self._prev_buf = None
+        self._frames = 0
+        # Scratch buffer for partial writes, byte 0 is the Co=0, D/C=1 control byte
+        self._data_buf = bytearray(((height // 8) * width) + 1)
+        self._data_buf[0] = 0x40
+        # Window command stream: Co=0, D/C=0 control byte followed by the
+        # column address and page address commands with their arguments
+        xpos0 = 0
+        xpos1 = width - 1
+        if width != 128:
+            # narrow displays use centered columns
+            col_offset = (128 - width) // 2
+            xpos0 += col_offset
+            xpos1 += col_offset
+        self._window_cmd = bytearray((0x00, SET_COL_ADDR, xpos0, xpos1, SET_PAGE_ADDR, 0, 0))
+        self._window = None
+        super().__init__(width, height, i2c, **kwargs)
+
+    def show(self, force=False):
+        """
+        Update the display.
+
+        Parameters:
+          force - Send the whole framebuffer even if nothing changed.
+        """
+        if self.page_addressing:
+            super().show()
+            return
+
+        if force or self._prev_buf is None or self._frames >= FULL_REFRESH:
+            # Re-send the window too, in case the display was reset behind our back
+            self._window = None
+            self._set_window(0, self.pages - 1)
+            # self.buffer already starts with the data control byte
+            with self.i2c_device:
+                self.i2c_device.write(self.buffer)
+            self._frames = 0
+            self._prev_buf = bytearray(self.buffer)
+            return
+
+        self._frames += 1
+        # Nothing changed since the last frame sent: no I2C traffic at all.
+        # One bytes comparison in C, cheaper than the page by page diff below.
+        if self.buffer == self._prev_buf:
+            return
+
+        # Compare page by page (byte 0 of the buffer is the control byte)
+        width = self.width
+        dirty = [self.buffer[start:start + width] != self._prev_buf[start:start + width]
+                 for start in range(1, len(self.buffer), width)]
+
+        # Send each run of consecutive dirty pages as one window
+        page = 0
+        while page < self.pages:
+            if not dirty[page]:
+                page += 1
+                continue
+            first = page
+            while page + 1 < self.pages and dirty[page + 1]:
+                page += 1
+            self._write_pages(first, page)
+            page += 1
+
+        self._prev_buf[:] = self.buffer
+
+    def _set_window(self, first, last):
+        """
+        Point the display RAM window at pages first..last.
+
+        Every data write fills the whole window, and horizontal addressing mode
+        wraps back to its start, so an unchanged window doesn't need re-sending.
+        """
+        if self._window == (first, last):
+            return
+        self._window_cmd[5] = first
+        self._window_cmd[6] = last
+        with self.i2c_device:
+            self.i2c_device.write(self._window_cmd)
+        self._window = (first, last)
+
+    def _write_pages(self, first, last):
+        """Send just the bytes of pages first..last."""
+        self._set_window(first, last)
+        start = 1 + first * self.width
+        end = 1 + (last + 1) * self.width
+        length = end - start
+        self._data_buf[1:1 + length] = self.buffer[start:end]
+        with self.i2c_device:
+            self.i2c_device.write(self._data_buf, end=1 + length)
+
+
+class FastSSD1306_SPI(FastImageMixin, adafruit_ssd1306.SSD1306_SPI):
+    """SSD1306_SPI with the faster image()."""
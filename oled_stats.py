@@ -0,0 +1,596 @@
+#!/usr/bin/env python3
+"""
+OLED Stats Display for Raspberry Pi
+
+Based on Michael Klements' original scripts for the Raspberry Pi Desktop Case with OLED Stats
+Display, the psutil version by Jurgen Pfeifer and the scrolling/NAS versions by Laurent Garcia.
+All display layouts live in this one script; pick one with --mode:
+
+  scroll  (stats.py)
+    - Line 0: "IP: <IP>" (static).
+    - Line 1: "CPU: <load> | <temp>" (scrolls if needed).
+    - Line 2: "Mem: <mem>" (scrolls if needed).
+    - Line 3: "<disk>" (scrolls if needed; all disk info concatenated).
+
+  icon    (monitor.py)
+    - Icons with the temperature, memory usage, root disk usage, CPU load and IP address.
+
+  compact (psutilstats.py)
+    - Plain text lines: IP, CPU usage and temperature, memory in MB, root disk in GB.
+
+  paged   (statsAndmonitor.py)
+    - Alternates every MODE_DURATION seconds between the scroll layout, with "Temp: " and
+      "Disk: " labels added to lines 1 and 3, and a disk overview:
+      a centered "Disk Usage:" header and up to three disks, one per row, each scrolling
+      horizontally if too long.
+
+stats.py, monitor.py, psutilstats.py and statsAndmonitor.py are kept as small wrappers that start
+the matching mode, so existing start-up scripts keep working.
+"""
+
+import argparse
+import functools
+import math
+import threading
+import time
+import board
+from PIL import Image, ImageDraw, ImageFont
+from fastoled import FastSSD1306_I2C, FastSSD1306_SPI
+import psutil
+import socket
+import subprocess
+
+# ---------------------------
+# Settings
+# ---------------------------
+# Display parameters
+WIDTH = 128
+HEIGHT = 64
+I2C_ADDRESS = 0x3C
+RESET_PIN = 4           # GPIO 4 (D4), active low
+# Pins for a display wired to SPI (--spi), as in Adafruit's SSD1306 SPI examples
+SPI_DC_PIN = 6          # GPIO 6 (D6), data/command
+SPI_CS_PIN = 5          # GPIO 5 (D5), chip select
+
+LOOPTIME = 1.0          # Metric update interval (seconds)
+REFRESH_INTERVAL = 0.1  # Scroll frame period (seconds)
+MODE_DURATION = 30      # Seconds per page in paged mode
+
+# Set to e.g. "eth0" or "wlan0" to always show the address of that interface.
+# By default the address of the interface with the default route is shown.
+IP_INTERFACE = None
+
+KB = 1024
+MB = KB * 1024
+GB = MB * 1024
+
+# Prime the CPU counters for the compact mode. Every later cpu_percent(interval=None)
+# call returns the usage since the previous call without sleeping. Priming this early
+# puts the font loading, reset pulse and display init in the first sample, which two
+# back-to-back calls would leave below the kernel's tick resolution (reading 0.0%).
+psutil.cpu_percent(interval=None)
+
+# ---------------------------
+# Drawing Setup
+# ---------------------------
+# Create an image buffer for drawing
+image = Image.new('1', (WIDTH, HEIGHT))
+draw = ImageDraw.Draw(image)
+
+# Load the fonts once. Make sure the .ttf font files are in the same directory as the python script!
+try:
+    main_font = ImageFont.truetype('PixelOperator.ttf', 16)
+except Exception as e:
+    print("Error loading PixelOperator.ttf, using default font:", e)
+    main_font = ImageFont.load_default()
+try:
+    icon_font = ImageFont.truetype('lineawesome-webfont.ttf', 18)
+except Exception as e:
+    print("Error loading lineawesome-webfont.ttf, using default font (no icons):", e)
+    icon_font = ImageFont.load_default()
+
+SPACING = 20      # Gap (in pixels) between repetitions of scrolling text
+LINE_HEIGHT = 16  # Height of one text row
+SCROLL_STEP = 2   # Pixels scrolled per frame (adjust for scroll speed)
+
+# Bound once, so the per-frame drawing code skips the attribute lookup
+paste = image.paste
+
+# Pre-rendered text strips keyed by row y: (text, font, strip, scroll_length).
+# Text only changes every LOOPTIME, so scrolling just pastes these bitmaps.
+strips = {}
+
+# The display and its reset pin, created by setup_oled()
+oled = None
+oled_reset = None
+
+# ---------------------------
+# Metric Sources
+# ---------------------------
+# Keep the SoC thermal zone open and re-read it on each fetch (no vcgencmd fork)
+TEMP_PATH = '/sys/class/thermal/thermal_zone0/temp'
+try:
+    temp_file = open(TEMP_PATH)
+except OSError:
+    temp_file = None
+
+# The IP is cached and only looked up again when the network links change,
+# or every IP_REFRESH seconds in case it changed without a link change (DHCP)
+IP_REFRESH = 60
+cached_ip = "N/A"
+link_state = None
+last_ip_lookup = 0
+
+def lookup_ip():
+    """
+    Return the IPv4 address of IP_INTERFACE, or by default the address of the interface
+    the default route goes out of. Without a route, fall back to the first IPv4 address
+    that is not on the loopback interface.
+    """
+    if IP_INTERFACE is None:
+        try:
+            # connect() on a UDP socket sends no packet, it only makes the kernel pick
+            # the outgoing route and source address, which getsockname() then returns
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.connect(('10.0.0.0', 1))
+                return s.getsockname()[0]
+        except OSError:
+            pass
+    for name, addrs in psutil.net_if_addrs().items():
+        if name == "lo" or (IP_INTERFACE is not None and name != IP_INTERFACE):
+            continue
+        for addr in addrs:
+            if addr.family == socket.AF_INET:
+                return addr.address
+    return "N/A"
+
+def get_ip():
+    """Return the cached IP address, looking it up again only when an interface
+    appears, disappears or changes link state, when the cached address is older than
+    IP_REFRESH seconds, or while there is no address yet.
+    """
+    global cached_ip, link_state, last_ip_lookup
+    now = time.monotonic()
+    state = sorted((name, stats.isup) for name, stats in psutil.net_if_stats().items())
+    if state != link_state or cached_ip == "N/A" or now - last_ip_lookup >= IP_REFRESH:
+        link_state = state
+        cached_ip = lookup_ip()
+        last_ip_lookup = now
+    return cached_ip
+
+def read_temperature():
+    """Return the SoC temperature in degrees C."""
+    if temp_file is None:
+        # No thermal zone in sysfs, fall back to asking the firmware ("temp=48.3'C").
+        # Run vcgencmd directly (no /bin/sh) and cut the value out in Python.
+        output = subprocess.check_output(["vcgencmd", "measure_temp"]).decode('utf-8')
+        return float(output.strip().split('=', 1)[1].rstrip("'C"))
+    temp_file.seek(0)
+    return int(temp_file.read()) / 1000
+
+def format_size(num_bytes):
+    """Format a byte count the way `df -h` does (e.g. 3.2G, 29G), rounding up like df."""
+    scale = 1024
+    for unit in "KMGT":
+        if num_bytes < scale * 1024 or unit == "T":
+            break
+        scale *= 1024
+    # Dividing by a power of two is exact, so ceil() doesn't round float noise up
+    tenths = math.ceil(num_bytes * 10 / scale)
+    if tenths < 100:
+        return "{:.1f}{}".format(tenths / 10, unit)
+    return "{:d}{}".format(math.ceil(num_bytes / scale), unit)
+
+def used_percent(usage):
+    """Return the used percentage of a disk_usage() result, rounded up like df's Use%
+    (0 for a filesystem with no capacity, as psutil does)."""
+    capacity = usage.used + usage.free
+    if not capacity:
+        return 0
+    return -(-usage.used * 100 // capacity)
+
+# ---------------------------
+# Metric Collection
+# ---------------------------
+def fetch_metrics():
+    """Fetch the metrics for the scroll and paged modes and return them in a dictionary.
+       For disk info, split each disk line into a list.
+    """
+    metrics = {}
+    try:
+        metrics['IP'] = get_ip()
+    except Exception:
+        metrics['IP'] = "N/A"
+    try:
+        metrics['CPU'] = "{:.2f}".format(psutil.getloadavg()[0])
+    except Exception:
+        metrics['CPU'] = "N/A"
+    try:
+        metrics['Temp'] = "{:.1f}'C".format(read_temperature())
+    except Exception:
+        metrics['Temp'] = "N/A"
+    try:
+        mem = psutil.virtual_memory()
+        metrics['Mem'] = "{:.1f}/{:.1f}GB {:.0f}%".format(mem.used / GB, mem.total / GB, mem.used * 100 / mem.total)
+    except Exception:
+        metrics['Mem'] = "N/A"
+    try:
+        # One entry per disk. For each /dev disk, output: "dev:used(perc)"
+        # The mount table is read on every fetch (one /proc/mounts read), so an unmounted
+        # disk drops off at once instead of showing the parent filesystem under its name.
+        disk_lines = []
+        for part in psutil.disk_partitions(all=False):
+            if not part.device.startswith('/dev/'):
+                continue
+            try:
+                usage = psutil.disk_usage(part.mountpoint)
+            except OSError:
+                # Unmounted between the two reads, skip just this disk
+                continue
+            disk_lines.append("{}:{}({:d}%)".format(part.device, format_size(usage.used), used_percent(usage)))
+        if disk_lines:
+            metrics['Disk'] = disk_lines
+        else:
+            metrics['Disk'] = ["N/A"]
+    except Exception:
+        metrics['Disk'] = ["N/A"]
+    return metrics
+
+def fetch_icon_metrics():
+    """Fetch the metrics for the icon mode, formatted to fit next to their icons."""
+    metrics = {}
+    try:
+        metrics['IP'] = get_ip()
+    except Exception:
+        metrics['IP'] = "N/A"
+    try:
+        metrics['CPU'] = "{:.2f}LA".format(psutil.getloadavg()[0])
+    except Exception:
+        metrics['CPU'] = "N/A"
+    try:
+        metrics['Temp'] = "{:.1f}'C".format(read_temperature())
+    except Exception:
+        metrics['Temp'] = "N/A"
+    try:
+        mem = psutil.virtual_memory()
+        metrics['Mem'] = "{:.2f}%".format(mem.used * 100 / mem.total)
+    except Exception:
+        metrics['Mem'] = "N/A"
+    try:
+        root = psutil.disk_usage("/")
+        metrics['Disk'] = "{:d}/{:d}GB".format(math.ceil(root.used / GB), math.ceil(root.total / GB))
+    except Exception:
+        metrics['Disk'] = "N/A"
+    return metrics
+
+def fetch_compact_metrics():
+    """Fetch the metrics for the compact mode, each string already carrying its label."""
+    metrics = {}
+    try:
+        ip = get_ip()
+        metrics['IP'] = "IP ?" if ip == "N/A" else "IP " + ip
+    except Exception:
+        metrics['IP'] = "IP ?"
+    try:
+        metrics['CPU'] = "CPU {:.1f}%".format(psutil.cpu_percent(interval=None))
+    except Exception:
+        metrics['CPU'] = "CPU ?"
+    try:
+        metrics['Temp'] = "{:.1f}°C".format(read_temperature())
+    except Exception:
+        metrics['Temp'] = "?°C"
+    try:
+        mem = psutil.virtual_memory()
+        metrics['Mem'] = "Mem {:5d}/{:5d}MB".format(round((mem.used + MB - 1) / MB), round((mem.total + MB - 1) / MB))
+    except Exception:
+        metrics['Mem'] = "Mem ?"
+    try:
+        root = psutil.disk_usage("/")
+        metrics['Disk'] = "Disk {:4d}/{:4d}GB".format(round((root.used + GB - 1) / GB), round((root.total + GB - 1) / GB))
+    except Exception:
+        metrics['Disk'] = "Disk ?"
+    return metrics
+
+class MetricsCollector(threading.Thread):
+    """
+    Background thread that refreshes the metrics every LOOPTIME seconds, so a slow
+    fetch never stalls the scrolling. The display loop reads `snapshot`; each update
+    swaps in a new dictionary (an atomic reference assignment), so no lock is needed.
+    """
+
+    def __init__(self, fetch=fetch_metrics, interval=LOOPTIME):
+        super().__init__(daemon=True)
+        self.fetch = fetch
+        self.interval = interval
+        self.snapshot = fetch()  # initial metrics
+
+    def run(self):
+        next_update = time.monotonic()
+        while True:
+            next_update = wait_for_next_frame(next_update, self.interval)
+            self.snapshot = self.fetch()
+
+# ---------------------------
+# Text Helpers
+# ---------------------------
+@functools.lru_cache(maxsize=64)
+def text_width(text, font=main_font):
+    """Return the rendered width of text in pixels. Strings only change on a
+    metric update, so the textbbox() result is cached per (text, font)."""
+    # Use textbbox to compute text width (instead of deprecated textsize)
+    bbox = draw.textbbox((0, 0), text, font=font)
+    return bbox[2] - bbox[0]
+
+def get_strip(y, text, font=main_font):
+    """
+    Return (strip, scroll_length) for the line at vertical position y, where strip is
+    a pre-rendered 1-bit image of the text, text_width + SPACING pixels wide and at
+    least WIDTH, so pasting it at x=0 always paints the whole row. scroll_length is
+    the strip width for text wider than the display, or 0 for text that fits.
+    The text is only rasterized again when it (or the font) changes on that line.
+    """
+    cached = strips.get(y)
+    if cached is None or cached[0] != text or cached[1] is not font:
+        width = text_width(text, font)
+        strip = Image.new('1', (max(width + SPACING, WIDTH), LINE_HEIGHT))
+        ImageDraw.Draw(strip).text((0, 0), text, font=font, fill=255)
+        scroll_length = width + SPACING if width > WIDTH else 0
+        cached = strips[y] = (text, font, strip, scroll_length)
+    return cached[2], cached[3]
+
+def draw_scrolling_text_infinite(y, text, offset, font=main_font):
+    """
+    Draws text with infinite horizontal scrolling at vertical position y.
+    Returns updated offset.
+    """
+    strip, total_length = get_strip(y, text, font)
+    if not total_length:
+        paste(strip, (0, y))
+        return 0
+    effective_offset = offset % total_length
+    paste(strip, (-effective_offset, y))
+    if total_length - effective_offset < WIDTH:
+        paste(strip, (total_length - effective_offset, y))
+    return offset + SCROLL_STEP
+
+# ---------------------------
+# Display Modes
+# ---------------------------
+def display_scrolling_mode(metrics, offsets, labels=False):
+    """
+    Display metrics in scrolling mode:
+      - Line 0: "IP: <IP>" (static).
+      - Line 1: "CPU: <load> | <temp>" (scrolls).
+      - Line 2: "Mem: <mem>" (scrolls).
+      - Line 3: "<disk>" (scrolls; concatenated).
+    With labels (the paged mode), lines 1 and 3 read "CPU: <load> | Temp: <temp>"
+    and "Disk: <disk>".
+    Every row is painted by a pasted strip, so the image is not cleared first.
+    Returns updated offsets.
+    """
+    # Static IP line, only re-rendered when the IP changes
+    paste(get_strip(0, "IP: " + metrics['IP'])[0], (0, 0))
+    temp_label, disk_label = ("Temp: ", "Disk: ") if labels else ("", "")
+    cpu_text = "CPU: " + metrics['CPU'] + " | " + temp_label + metrics['Temp']
+    offsets['CPU'] = draw_scrolling_text_infinite(16, cpu_text, offsets['CPU'])
+    offsets['Mem'] = draw_scrolling_text_infinite(32, "Mem: " + metrics['Mem'], offsets['Mem'])
+    # Concatenate all disk lines into one string.
+    disk_concat = " ".join(metrics['Disk'])
+    offsets['Disk'] = draw_scrolling_text_infinite(48, disk_label + disk_concat, offsets['Disk'])
+    oled.image(image)
+    oled.show()
+    return offsets
+
+def display_disk_overview_mode(metrics, disk_offsets):
+    """
+    Display Disk Overview Mode:
+      - Row 0: Centered header "Disk Usage:"
+      - Rows 1 to 3: Each row displays one disk's info (if available), scrolling horizontally.
+    The disk info is taken from metrics['Disk'] (a list of disk lines).
+    Uses a dictionary disk_offsets for independent horizontal scrolling per disk.
+    Rows are painted by pasted strips (or blanked), so the image is not cleared first.
+    Returns updated disk_offsets.
+    """
+    # Header centered on row 0
+    header = "Disk Usage:"
+    header_x = (WIDTH - text_width(header)) // 2
+    paste(0, (0, 0, header_x, LINE_HEIGHT))
+    paste(get_strip(0, header)[0], (header_x, 0))
+
+    disk_lines = metrics.get('Disk', ["N/A"])
+    # We'll display up to 3 disks (rows 1, 2, and 3 at y=16, 32, 48)
+    for i in range(min(3, len(disk_lines))):
+        y = 16 + i * 16
+        # Use the corresponding offset for this disk line
+        disk_offsets[i] = draw_scrolling_text_infinite(y, disk_lines[i], disk_offsets.get(i, 0), font=main_font)
+    # Blank the rows left over when there are fewer than 3 disks, and drop their
+    # strips so a scrolling line from the other page can't keep run_scrolling() drawing
+    for i in range(len(disk_lines), 3):
+        y = 16 + i * 16
+        paste(0, (0, y, WIDTH, y + LINE_HEIGHT))
+        strips.pop(y, None)
+    oled.image(image)
+    oled.show()
+    return disk_offsets
+
+def display_icon_mode(metrics):
+    """
+    Display the icon layout: temperature and memory on the first row, disk and CPU load
+    on the second, IP address on the third, each value next to its icon.
+    """
+    top = -2
+    x = 0
+    # Clear the image (paste a solid black box: one memset in C)
+    paste(0, (0, 0, WIDTH, HEIGHT))
+
+    # Icons: temperature, memory, disk, cpu, wifi
+    draw.text((x, top + 5), chr(62609), font=icon_font, fill=255)
+    draw.text((x + 65, top + 5), chr(62776), font=icon_font, fill=255)
+    draw.text((x, top + 25), chr(63426), font=icon_font, fill=255)
+    draw.text((x + 65, top + 25), chr(62171), font=icon_font, fill=255)
+    draw.text((x, top + 45), chr(61931), font=icon_font, fill=255)
+
+    # Text next to each icon
+    draw.text((x + 19, top + 5), metrics['Temp'], font=main_font, fill=255)
+    draw.text((x + 87, top + 5), metrics['Mem'], font=main_font, fill=255)
+    draw.text((x + 19, top + 25), metrics['Disk'], font=main_font, fill=255)
+    draw.text((x + 87, top + 25), metrics['CPU'], font=main_font, fill=255)
+    draw.text((x + 19, top + 45), metrics['IP'], font=main_font, fill=255)
+
+    oled.image(image)
+    oled.show()
+
+def display_compact_mode(metrics):
+    """
+    Display the compact text layout, one 16 pixel line each for the IP address,
+    CPU usage with the temperature on the right, memory and root disk usage.
+    """
+    top = -2
+    x = 0
+    # Clear the image (paste a solid black box: one memset in C)
+    paste(0, (0, 0, WIDTH, HEIGHT))
+
+    draw.text((x, top),                    metrics['IP'],   font=main_font, fill=255)
+    draw.text((x, top + LINE_HEIGHT),      metrics['CPU'],  font=main_font, fill=255)
+    draw.text((x + 80, top + LINE_HEIGHT), metrics['Temp'], font=main_font, fill=255)
+    draw.text((x, top + 2 * LINE_HEIGHT),  metrics['Mem'],  font=main_font, fill=255)
+    draw.text((x, top + 3 * LINE_HEIGHT),  metrics['Disk'], font=main_font, fill=255)
+
+    oled.image(image)
+    oled.show()
+
+# ---------------------------
+# Setup & Main Loops
+# ---------------------------
+def setup_oled(reset=True, spi=False):
+    """
+    Pulse the display reset pin (unless reset is False), then create and clear the display,
+    on the I2C bus or on the SPI bus if spi is True.
+    """
+    global oled, oled_reset
+    if reset:
+        # Use gpiozero to control the reset pin (active low). Imported here so the
+        # compact mode with --no-reset also runs where gpiozero isn't installed.
+        import gpiozero
+        oled_reset = gpiozero.OutputDevice(RESET_PIN, active_high=False)
+        # Manually reset the display (high -> low -> high for reset pulse).
+        # The SSD1306 needs the pin low for only 3us, 10ms is plenty of margin.
+        oled_reset.on()
+        time.sleep(0.01)
+        oled_reset.off()
+        time.sleep(0.01)
+        oled_reset.on()
+
+    if spi:
+        # SPI Setup (8MHz), the reset pin is pulsed above so the driver gets none.
+        # digitalio and the pins are only needed here, so I2C setups work without them.
+        import digitalio
+        dc = digitalio.DigitalInOut(getattr(board, "D%d" % SPI_DC_PIN))
+        cs = digitalio.DigitalInOut(getattr(board, "D%d" % SPI_CS_PIN))
+        oled = FastSSD1306_SPI(WIDTH, HEIGHT, board.SPI(), dc, None, cs)
+    else:
+        # I2C Setup
+        # The bus speed can't be set from Python on the Pi, it comes from
+        # dtparam=i2c_arm_baudrate in /boot/firmware/config.txt (see README)
+        i2c = board.I2C()
+        oled = FastSSD1306_I2C(WIDTH, HEIGHT, i2c, addr=I2C_ADDRESS)
+
+    # Clear the display
+    oled.fill(0)
+    oled.show()
+
+def wait_for_next_frame(next_frame, interval):
+    """
+    Sleep until the deadline next_frame + interval and return it. The deadline advances
+    in fixed steps so render and I2C time don't add up to drift; if a frame overran it,
+    return the current time instead so the schedule restarts from now.
+    """
+    next_frame += interval
+    delay = next_frame - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+        return next_frame
+    return time.monotonic()
+
+def run_scrolling(paged=False):
+    """
+    Main loop for the scroll and paged modes: redraws every REFRESH_INTERVAL seconds while
+    a MetricsCollector thread refreshes the metrics. In paged mode the disk overview page
+    is shown every other MODE_DURATION seconds.
+    """
+    # Offsets for the scrolling page (for CPU, Mem, Disk concatenated)
+    offsets = {'CPU': 0, 'Mem': 0, 'Disk': 0}
+    # Offsets for the disk overview page (one per disk line)
+    disk_overview_offsets = {0: 0, 1: 0, 2: 0}
+    current_mode = 0  # 0 = scrolling page (all metrics), 1 = disk overview page
+    mode_start_time = time.monotonic()
+    # Metrics are refreshed every LOOPTIME seconds in the background
+    collector = MetricsCollector()
+    collector.start()
+    drawn_metrics = None  # Snapshot shown by the last frame drawn
+
+    next_frame = time.monotonic()
+    while True:
+        current_time = time.monotonic()
+        # Switch page every MODE_DURATION seconds
+        if paged and current_time - mode_start_time >= MODE_DURATION:
+            current_mode = 1 - current_mode  # Toggle page
+            mode_start_time = current_time
+            drawn_metrics = None
+
+        # Latest metrics from the collector thread
+        metrics = collector.snapshot
+
+        # With the same snapshot on screen and no row scrolling, the frame would be
+        # identical: skip the drawing and the framebuffer packing entirely
+        if metrics is not drawn_metrics or any(cached[3] for cached in strips.values()):
+            if current_mode == 0:
+                offsets = display_scrolling_mode(metrics, offsets, labels=paged)
+            else:
+                disk_overview_offsets = display_disk_overview_mode(metrics, disk_overview_offsets)
+            drawn_metrics = metrics
+
+        next_frame = wait_for_next_frame(next_frame, REFRESH_INTERVAL)
+
+def run_static(fetch, display):
+    """
+    Main loop for the icon and compact modes: draw and show the latest metrics once every
+    LOOPTIME seconds. The metrics come from a MetricsCollector thread like in the scrolling
+    modes, so a slow read never delays a frame. When the values haven't changed since the
+    last frame drawn, the text rendering and the display update are skipped.
+    """
+    collector = MetricsCollector(fetch)
+    collector.start()
+    drawn_metrics = None
+
+    next_frame = time.monotonic()
+    while True:
+        metrics = collector.snapshot
+        if metrics != drawn_metrics:
+            display(metrics)
+            drawn_metrics = metrics
+        next_frame = wait_for_next_frame(next_frame, LOOPTIME)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show Raspberry Pi stats on an SSD1306 OLED display.")
+    parser.add_argument('--mode', choices=('scroll', 'icon', 'compact', 'paged'), default='scroll',
+                        help="display layout (default: scroll)")
+    parser.add_argument('--no-reset', action='store_true',
+                        help="don't pulse the display reset pin (GPIO %d) on start-up" % RESET_PIN)
+    parser.add_argument('--spi', action='store_true',
+                        help="the display is wired to SPI instead of I2C")
+    args = parser.parse_args(argv)
+
+    setup_oled(reset=not args.no_reset, spi=args.spi)
+
+    if args.mode == 'scroll':
+        run_scrolling()
+    elif args.mode == 'paged':
+        run_scrolling(paged=True)
+    elif args.mode == 'icon':
+        run_static(fetch_icon_metrics, display_icon_mode)
+    else:
+        run_static(fetch_compact_metrics, display_compact_mode)
+
+if __name__ == '__main__':
+    main()